@@ -2,17 +2,46 @@
 """
 BBC RSS Scraper - Main entry point.
 
-This script fetches RSS feeds from BBC News and saves the data to JSON files.
+This script fetches RSS feeds from BBC News and saves the data to gzipped JSON files.
 """
 import os
 import argparse
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import zip_longest
+from urllib.parse import urlparse
 
 # Import from modules package
-from modules.scraper import load_feed_urls, fetch_feed, extract_entries
-from modules.storage import save_entries
+from modules.scraper import load_feed_urls, fetch_and_extract, close_session, NOT_MODIFIED
+from modules.storage import save_entries, load_saved_entries, load_http_cache, save_http_cache
 from modules.utils import setup_logging, resolve_path, format_entries_summary
 
+# The async fetcher needs httpx with HTTP/2 support; fall back to a thread pool without it
+try:
+    from modules.async_scraper import gather_all, MAX_CONCURRENT_FETCHES
+except ImportError:
+    gather_all = None
+
+# Default number of worker threads for the thread pool fallback
+DEFAULT_WORKERS = 10
+
+@lru_cache(maxsize=1)
+def script_dir():
+    """Return the directory containing this script"""
+    return os.path.dirname(os.path.abspath(__file__))
+
+def positive_int(value):
+    """Argparse type accepting integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -21,6 +50,8 @@ def parse_args():
   python main.py
   python main.py --feeds custom_feeds.txt --data-dir ./output
   python main.py -f custom_feeds.txt -d ./output -l 10 -v
+  python main.py -w 20
+  python main.py --http-cache
         """
     )
     
@@ -45,6 +76,20 @@ def parse_args():
         help='Limit the number of entries per feed (default: no limit)'
     )
     
+    parser.add_argument(
+        '--workers', '-w',
+        type=positive_int,
+        default=None,
+        help='Maximum number of feeds fetched concurrently (default: 20 with httpx, 10 otherwise)'
+    )
+    
+    parser.add_argument(
+        '--http-cache',
+        action='store_true',
+        help='Send conditional requests using ETag/Last-Modified values from previous runs and '
+             'merge new entries into today\'s output file'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -63,20 +108,68 @@ def parse_args():
 
 def validate_feeds_file(feeds_file):
     """Validate that the feeds file exists and is readable"""
-    if not os.path.exists(feeds_file):
+    try:
+        open(feeds_file, 'r', encoding='utf-8').close()
+    except FileNotFoundError:
         print(f"Error: Feeds file '{feeds_file}' not found.")
         return False
-    
-    if not os.path.isfile(feeds_file):
+    except IsADirectoryError:
         print(f"Error: '{feeds_file}' is not a file.")
         return False
-    
-    if not os.access(feeds_file, os.R_OK):
+    except PermissionError:
         print(f"Error: Cannot read feeds file '{feeds_file}'. Check permissions.")
         return False
+    except OSError as e:
+        print(f"Error: Cannot open feeds file '{feeds_file}': {e.strerror or e}")
+        return False
     
     return True
 
+def _interleave_by_domain(urls):
+    """Reorder URLs round-robin by host so consecutive fetches hit different hosts"""
+    by_host = {}
+    for url in urls:
+        try:
+            host = urlparse(url).netloc
+        except ValueError:  # e.g. 'http://[bad/feed.xml'; still dispatched so it is reported as failed
+            host = ''
+        by_host.setdefault(host, []).append(url)
+    
+    return [url for slot in zip_longest(*by_host.values()) for url in slot if url is not None]
+
+def _add_unique(entries, all_entries, seen):
+    """Append entries not already collected, keyed by link; return how many were added"""
+    added = 0
+    for entry in entries:
+        # Entries without a link can only be matched by their full contents
+        key = entry.link or entry
+        if key in seen:
+            continue
+        seen.add(key)
+        all_entries.append(entry)
+        added += 1
+    return added
+
+def fetch_all(urls, workers=None, cache=None):
+    """Fetch all feeds concurrently, returning (url, entries or exception) pairs"""
+    if gather_all is not None:
+        results = asyncio.run(gather_all(urls, workers or MAX_CONCURRENT_FETCHES, cache))
+        return list(zip(urls, results))
+    
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers or DEFAULT_WORKERS) as executor:
+            futures = {executor.submit(fetch_and_extract, url, cache): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results.append((url, future.result()))
+                except Exception as e:
+                    results.append((url, e))
+    finally:
+        close_session()
+    return results
+
 def main():
     """Main entry point for the script"""
     # Parse command line arguments
@@ -87,9 +180,8 @@ def main():
     setup_logging(log_level)
     
     # Resolve paths
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    feeds_file = resolve_path(script_dir, args.feeds)
-    data_dir = resolve_path(script_dir, args.data_dir)
+    feeds_file = resolve_path(script_dir(), args.feeds)
+    data_dir = resolve_path(script_dir(), args.data_dir)
     
     # Validate feeds file
     if not validate_feeds_file(feeds_file):
@@ -104,30 +196,38 @@ def main():
     if args.verbose:
         print(f"Loaded {len(urls)} feed URLs from {feeds_file}")
     
+    urls = _interleave_by_domain(urls)
+    
     # Fetch and parse all feeds
     all_entries = []
     failed_urls = []
+    seen_entries = set()
+    http_cache = load_http_cache(data_dir) if args.http_cache else None
     
-    for url in urls:
-        try:
-            feed = fetch_feed(url)
-            if feed:
-                entries = extract_entries(feed)
-                
-                # Apply limit if specified
-                if args.limit is not None and len(entries) > args.limit:
-                    if args.verbose:
-                        print(f"Limiting entries from {url} to {args.limit} (from {len(entries)})")
-                    entries = entries[:args.limit]
-                
-                all_entries.extend(entries)
-                
+    for url, entries in fetch_all(urls, args.workers, http_cache):
+        if isinstance(entries, Exception):
+            failed_urls.append((url, str(entries) or type(entries).__name__))
+        elif entries is NOT_MODIFIED:
+            if args.verbose:
+                print(f"No new entries from {url} (not modified)")
+        elif entries is not None:
+            # Apply limit if specified
+            if args.limit is not None and len(entries) > args.limit:
                 if args.verbose:
-                    print(f"Fetched {len(entries)} entries from {url}")
-            else:
-                failed_urls.append((url, "No data returned"))
-        except Exception as e:
-            failed_urls.append((url, str(e)))
+                    print(f"Limiting entries from {url} to {args.limit} (from {len(entries)})")
+                entries = entries[:args.limit]
+            
+            # Skip stories already collected from another feed
+            added = _add_unique(entries, all_entries, seen_entries)
+            
+            if args.verbose:
+                duplicates = len(entries) - added
+                if duplicates:
+                    print(f"Fetched {added} entries from {url} (skipped {duplicates} duplicates)")
+                else:
+                    print(f"Fetched {added} entries from {url}")
+        else:
+            failed_urls.append((url, "No data returned"))
     
     # Report on failed URLs if any
     if failed_urls and args.verbose:
@@ -135,8 +235,17 @@ def main():
         for url, reason in failed_urls:
             print(f"  - {url}: {reason}")
     
-    # Save all entries to a file
+    # Unchanged feeds contribute no entries, so keep the ones already saved today
+    if http_cache is not None:
+        try:
+            _add_unique(load_saved_entries(data_dir), all_entries, seen_entries)
+        except Exception as e:
+            print(f"Failed to load saved entries: {str(e)}")
+            return 1
+    
+    # Save all entries to a file, newest first
     if all_entries:
+        all_entries.sort(key=lambda entry: entry.published_ts, reverse=True)
         try:
             output_file = save_entries(all_entries, data_dir)
             print(f"Successfully saved {len(all_entries)} entries to {output_file}")
@@ -147,6 +256,10 @@ def main():
     else:
         print("No entries found in any feeds.")
     
+    # Only remember validators once the entries they describe are saved
+    if http_cache is not None:
+        save_http_cache(http_cache, data_dir)
+    
     return 0
 
 if __name__ == "__main__":
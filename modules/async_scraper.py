@@ -0,0 +1,111 @@
+"""
+Concurrent RSS feed fetching using asyncio and httpx over HTTP/2.
+"""
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+
+import httpx
+import h2  # noqa: F401 -- required by httpx for http2=True
+
+from modules.scraper import (
+    parse_entries, new_xml_parser, conditional_headers, update_http_cache, retry_delay,
+    retry_after_delay, NOT_MODIFIED, DEFAULT_HEADERS, RETRY_TOTAL, RETRY_STATUSES
+)
+
+# Configure logging
+logger = logging.getLogger('bbc-rss-scraper')
+
+# Maximum number of feeds in flight at once
+MAX_CONCURRENT_FETCHES = 20
+
+async def fetch_and_extract_async(client: httpx.AsyncClient, url: str, sem: asyncio.Semaphore,
+                                  cache: Optional[Dict[str, Dict[str, str]]] = None) -> Any:
+    """
+    Fetch an RSS feed and extract its entries asynchronously.
+
+    Args:
+        client: Shared httpx client
+        url: URL of the RSS feed
+        sem: Semaphore bounding the number of concurrent requests
+        cache: Optional HTTP validator cache used for conditional requests
+
+    Returns:
+        List of entries, NOT_MODIFIED if the feed is unchanged
+        since the cached response, or None if the feed has no channel
+
+    Raises:
+        httpx.HTTPError: If the request fails or still returns a 4XX/5XX
+            status after retrying transient server errors
+    """
+    try:
+        logger.info("Fetching feed: %s", url)
+
+        for attempt in range(RETRY_TOTAL + 1):
+            async with sem, client.stream('GET', url, headers=conditional_headers(cache, url)) as response:
+                if response.status_code == 304:
+                    logger.info("Feed not modified: %s", url)
+                    return NOT_MODIFIED
+
+                if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+
+                    # Feed the decompressed body to lxml as it arrives
+                    parser = new_xml_parser()
+                    async for chunk in response.aiter_bytes():
+                        parser.feed(chunk)
+                    root = parser.close()
+                    break
+
+            # Back off outside the semaphore so other feeds can proceed,
+            # waiting as long as the server asked via Retry-After if it did
+            delay = retry_after_delay(response.headers.get('Retry-After'))
+            if delay is None:
+                delay = retry_delay(attempt)
+            logger.warning("Retrying %s (status %d) in %.1fs, retry %d of %d",
+                           url, response.status_code, delay, attempt + 1, RETRY_TOTAL)
+            await asyncio.sleep(delay)
+
+        entries = parse_entries(root, url)
+        # Don't let a body without a channel turn into a 304 next time
+        if entries is not None:
+            update_http_cache(cache, url, response.headers)
+        return entries
+
+    except httpx.HTTPError as e:
+        logger.error("Request error fetching feed %s: %s", url, e)
+        raise
+    except Exception as e:
+        logger.error("Error parsing feed %s: %s", url, e)
+        raise
+
+async def gather_all(urls: List[str], max_concurrent: int = MAX_CONCURRENT_FETCHES,
+                     cache: Optional[Dict[str, Dict[str, str]]] = None) -> List[Any]:
+    """
+    Fetch all feeds concurrently and extract their entries.
+
+    Requests to the same https:// host are multiplexed over a single HTTP/2
+    connection when the server negotiates it via ALPN; plain http:// feeds
+    use pooled HTTP/1.1 connections.
+
+    Args:
+        urls: List of feed URLs
+        max_concurrent: Maximum number of feeds fetched at once
+        cache: Optional HTTP validator cache used for conditional requests
+
+    Returns:
+        List with one result per URL, in the same order: the entry list,
+        NOT_MODIFIED, None, or the exception raised while fetching it
+    """
+    sem = asyncio.Semaphore(max_concurrent)
+    # Size the pool to the semaphore so queued requests never wait on a connection
+    limits = httpx.Limits(max_connections=max_concurrent, max_keepalive_connections=max_concurrent)
+    # Connection failures are retried by the transport, server errors above
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=RETRY_TOTAL)
+
+    async with httpx.AsyncClient(transport=transport, timeout=30, headers=DEFAULT_HEADERS,
+                                 follow_redirects=True) as client:
+        return await asyncio.gather(
+            *[fetch_and_extract_async(client, url, sem, cache) for url in urls],
+            return_exceptions=True
+        )
@@ -0,0 +1,7 @@
+"""
+Data structures shared across the BBC RSS scraper modules.
+"""
+from collections import namedtuple
+
+# A single news entry extracted from a feed
+Entry = namedtuple('Entry', 'title link published summary published_ts')
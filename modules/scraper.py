@@ -1,15 +1,176 @@
 """
-RSS feed fetching and parsing functionality using requests and BeautifulSoup4.
+RSS feed fetching and parsing functionality using requests and lxml.
 """
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import mmap
+import os
+import random
+from typing import List, Dict, Any, Optional, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from modules.models import Entry
 
 # Configure logging
 logger = logging.getLogger('bbc-rss-scraper')
 
+# Brotli responses can only be decoded when the brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip'
+
+# Headers sent with every feed request
+DEFAULT_HEADERS = {
+    'User-Agent': 'bbc-rss-scraper/1.0',
+    'Accept-Encoding': ACCEPT_ENCODING
+}
+
+# Retry policy for transient server errors
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_JITTER = 0.5
+RETRY_STATUSES = frozenset([500, 502, 503, 504])
+
+def retry_delay(attempt: int) -> float:
+    """
+    Compute the exponential backoff delay before a retry, with random jitter.
+    
+    Args:
+        attempt: Number of retries already made for the request
+        
+    Returns:
+        Delay in seconds
+    """
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt) + random.uniform(0, RETRY_JITTER)
+
+def retry_after_delay(value: Optional[str]) -> Optional[float]:
+    """
+    Interpret a Retry-After header as a delay.
+    
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+        
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class LoggingRetry(Retry):
+    """
+    urllib3 retry policy that logs every retry and adds jitter to the backoff.
+    """
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        reason = f"status {response.status}" if response is not None and response.status else error
+        logger.warning("Retrying %s %s (%s), %s retries left", method, url, reason, new_retry.total)
+        return new_retry
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, RETRY_JITTER) if backoff else backoff
+
+# Shared session so connections to the same host are kept alive and reused
+_SESSION = requests.Session()
+_SESSION.headers.update(DEFAULT_HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=LoggingRetry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True
+    )
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# Returned instead of a parsed feed when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+def new_xml_parser() -> Any:
+    """
+    Create an lxml parser configured for RSS documents.
+    
+    Whitespace-only text, comments and processing instructions are dropped
+    while parsing so no elements are built for them, and external entities
+    are never resolved or fetched.
+    
+    Returns:
+        lxml XMLParser instance (not safe to share between threads)
+    """
+    return etree.XMLParser(
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+        no_network=True
+    )
+
+def conditional_headers(cache: Optional[Dict[str, Dict[str, str]]], url: str) -> Dict[str, str]:
+    """
+    Build conditional request headers from the validators cached for a URL.
+    
+    Args:
+        cache: Mapping of feed URL to its cached ETag/Last-Modified validators
+        url: URL of the RSS feed
+        
+    Returns:
+        Dictionary of If-None-Match/If-Modified-Since headers (may be empty)
+    """
+    headers = {}
+    validators = (cache or {}).get(url, {})
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+def update_http_cache(cache: Optional[Dict[str, Dict[str, str]]], url: str,
+                      headers: Mapping[str, str]) -> None:
+    """
+    Store the ETag/Last-Modified validators from a response in the cache.
+    
+    Args:
+        cache: Mapping of feed URL to its cached validators, or None to skip
+        url: URL of the RSS feed
+        headers: Response headers
+    """
+    if cache is None:
+        return
+    validators = {
+        'etag': headers.get('ETag', ''),
+        'last_modified': headers.get('Last-Modified', '')
+    }
+    if validators['etag'] or validators['last_modified']:
+        cache[url] = validators
+    else:
+        cache.pop(url, None)
+
+def close_session() -> None:
+    """
+    Close the shared HTTP session and release its pooled connections.
+    """
+    _SESSION.close()
+
 def load_feed_urls(file_path: str) -> List[str]:
     """
     Load RSS feed URLs from a file.
@@ -21,118 +182,123 @@ def load_feed_urls(file_path: str) -> List[str]:
         List of feed URLs
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        logger.info(f"Loaded {len(urls)} feed URLs from {file_path}")
+        with open(file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                lines = []
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    lines = mm[:].splitlines()
+        urls = [
+            line.decode('utf-8').strip() for line in lines
+            if line.strip() and not line.startswith(b'#')
+        ]
+        logger.info("Loaded %d feed URLs from %s", len(urls), file_path)
         return urls
     except FileNotFoundError:
-        logger.error(f"Feed URL file not found: {file_path}")
+        logger.error("Feed URL file not found: %s", file_path)
         return []
     except Exception as e:
-        logger.error(f"Error loading feed URLs: {str(e)}")
+        logger.error("Error loading feed URLs: %s", e)
         return []
 
-def fetch_feed(url: str) -> Optional[Dict[str, Any]]:
+def fetch_and_extract(url: str, cache: Optional[Dict[str, Dict[str, str]]] = None) -> Any:
     """
-    Fetch and parse an RSS feed using requests and BeautifulSoup4.
+    Fetch an RSS feed and extract its entries using requests and lxml.
     
     Args:
         url: URL of the RSS feed
+        cache: Optional HTTP validator cache used for conditional requests
         
     Returns:
-        Parsed feed or None if there was an error
+        List of entries, NOT_MODIFIED if the feed is unchanged
+        since the cached response, or None if there was an error
     """
     try:
-        logger.info(f"Fetching feed: {url}")
-        
-        # Make HTTP request to fetch the RSS feed
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()  # Raise exception for 4XX/5XX responses
+        logger.info("Fetching feed: %s", url)
         
-        # Parse XML content with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'xml')
-        
-        # Extract channel information
-        channel = soup.find('channel')
-        if not channel:
-            logger.warning(f"No channel element found in feed: {url}")
-            return None
-            
-        # Extract items
-        items = channel.find_all('item')
-        if not items:
-            logger.warning(f"No items found in feed: {url}")
+        # Make HTTP request to fetch the RSS feed, streaming the body
+        with _SESSION.get(url, headers=conditional_headers(cache, url),
+                          timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                logger.info("Feed not modified: %s", url)
+                return NOT_MODIFIED
+            response.raise_for_status()  # Raise exception for 4XX/5XX responses
             
-        # Create feed dictionary similar to feedparser structure
-        feed = {
-            'feed': {
-                'title': get_text(channel.find('title')),
-                'link': get_text(channel.find('link')),
-                'description': get_text(channel.find('description'))
-            },
-            'entries': [],
-            'url': url
-        }
+            # Let lxml read the decompressed body straight from the socket
+            response.raw.decode_content = True
+            entries = parse_entries(etree.parse(response.raw, new_xml_parser()).getroot(), url)
         
-        # Parse each item and add to entries
-        for item in items:
-            entry = {
-                'title': get_text(item.find('title')),
-                'link': get_text(item.find('link')),
-                'published': get_text(item.find('pubDate')),
-                'description': get_text(item.find('description'))
-            }
-            feed['entries'].append(entry)
-            
-        logger.info(f"Successfully parsed feed with {len(feed['entries'])} entries")
-        return feed
+        # Don't let a body without a channel turn into a 304 next time
+        if entries is not None:
+            update_http_cache(cache, url, response.headers)
+        return entries
         
     except requests.RequestException as e:
-        logger.error(f"Request error fetching feed {url}: {str(e)}")
+        logger.error("Request error fetching feed %s: %s", url, e)
         return None
     except Exception as e:
-        logger.error(f"Error parsing feed {url}: {str(e)}")
+        logger.error("Error parsing feed %s: %s", url, e)
         return None
 
-def get_text(element) -> str:
+def parse_published(value: str) -> int:
     """
-    Extract text from a BeautifulSoup element safely.
+    Convert an RFC 2822 pubDate string to a Unix timestamp.
     
     Args:
-        element: BeautifulSoup element
+        value: Publication date as found in the feed
         
     Returns:
-        Text content or empty string if element is None
+        Seconds since the epoch, or 0 if the date is missing or invalid
     """
-    if element is None:
-        return ''
-    return element.get_text(strip=True)
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return 0
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return int(published.timestamp())
 
-def extract_entries(feed: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _entry_from_item(item: Any) -> Entry:
     """
-    Extract required fields from feed entries.
+    Build an entry from an RSS <item> element.
     
     Args:
-        feed: Parsed feed
+        item: Parsed <item> element
         
     Returns:
-        List of dictionaries with extracted entry data
+        Entry with the extracted data
+    """
+    published = (item.findtext('pubDate') or '').strip()
+    return Entry(
+        title=(item.findtext('title') or '').strip(),
+        link=(item.findtext('link') or '').strip(),
+        published=published,
+        summary=(item.findtext('description') or '').strip(),
+        published_ts=parse_published(published)
+    )
+
+def parse_entries(root: Any, url: str) -> Optional[List[Entry]]:
     """
-    entries = []
+    Extract required fields from the items of a parsed RSS document.
     
-    try:
-        for entry in feed.get('entries', []):
-            # Extract required fields
-            entry_data = {
-                'title': entry.get('title', ''),
-                'link': entry.get('link', ''),
-                'published': entry.get('published', ''),
-                'summary': entry.get('description', '')
-            }
-            entries.append(entry_data)
-            
-        logger.info(f"Extracted {len(entries)} entries from feed")
-        return entries
-    except Exception as e:
-        logger.error(f"Error extracting entries: {str(e)}")
-        return [] 
\ No newline at end of file
+    Args:
+        root: Root element of the parsed XML document
+        url: URL the feed was fetched from
+        
+    Returns:
+        List of entries with the extracted data, or None if the document
+        has no channel
+    """
+    channel = root.find('channel')
+    if channel is None:
+        logger.warning("No channel element found in feed: %s", url)
+        return None
+    
+    entries = [_entry_from_item(item) for item in channel.iterfind('item')]
+    
+    if not entries:
+        logger.warning("No items found in feed: %s", url)
+    
+    logger.info("Extracted %d entries from feed", len(entries))
+    return entries
\ No newline at end of file
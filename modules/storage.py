@@ -1,15 +1,26 @@
 """
 Storage functionality for saving data to disk.
 """
+import gzip
 import json
 import os
 import logging
-from datetime import datetime
-from typing import List, Dict, Any
+import time
+from typing import List, Dict
+
+from modules.models import Entry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger('bbc-rss-scraper')
 
+# File in the data directory holding ETag/Last-Modified validators per feed URL
+HTTP_CACHE_FILENAME = 'etag_cache.json'
+
 def ensure_data_directory(directory: str) -> None:
     """
     Ensure the data directory exists.
@@ -20,9 +31,9 @@ def ensure_data_directory(directory: str) -> None:
     try:
         if not os.path.exists(directory):
             os.makedirs(directory)
-            logger.info(f"Created directory: {directory}")
+            logger.info("Created directory: %s", directory)
     except Exception as e:
-        logger.error(f"Error creating directory {directory}: {str(e)}")
+        logger.error("Error creating directory %s: %s", directory, e)
         raise
 
 def generate_filename() -> str:
@@ -30,17 +41,61 @@ def generate_filename() -> str:
     Generate a filename based on the current date.
     
     Returns:
-        Filename in the format news_YYYYMMDD.json
+        Filename in the format news_YYYYMMDD.json.gz
     """
-    current_date = datetime.now().strftime('%Y%m%d')
-    return f"news_{current_date}.json"
+    return f"news_{time.strftime('%Y%m%d')}.json.gz"
 
-def save_entries(entries: List[Dict[str, Any]], data_dir: str) -> str:
+def serialize_entries(entries: List[Entry]) -> bytes:
     """
-    Save entries to a JSON file.
+    Serialize entries to UTF-8 encoded JSON, using orjson when available.
     
     Args:
-        entries: List of entry dictionaries to save
+        entries: List of entries to serialize
+        
+    Returns:
+        JSON document as bytes, with each entry written as an object
+    """
+    records = [entry._asdict() for entry in entries]
+    if orjson is not None:
+        return orjson.dumps(records, option=orjson.OPT_INDENT_2)
+    return json.dumps(records, ensure_ascii=False, indent=2).encode('utf-8')
+
+def load_saved_entries(data_dir: str) -> List[Entry]:
+    """
+    Load the entries already saved to today's file.
+    
+    Args:
+        data_dir: Directory the file was saved in
+        
+    Returns:
+        List of saved entries (empty if nothing has been saved today)
+    """
+    file_path = os.path.join(data_dir, generate_filename())
+    try:
+        with gzip.open(file_path, 'rb') as f:
+            records = json.loads(f.read())
+        return [
+            Entry(
+                title=record.get('title', ''),
+                link=record.get('link', ''),
+                published=record.get('published', ''),
+                summary=record.get('summary', ''),
+                published_ts=record.get('published_ts', 0)
+            )
+            for record in records
+        ]
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        logger.error("Error loading saved entries from %s: %s", file_path, e)
+        raise
+
+def save_entries(entries: List[Entry], data_dir: str) -> str:
+    """
+    Save entries to a gzip-compressed JSON file.
+    
+    Args:
+        entries: List of entries to save
         data_dir: Directory to save the file in
         
     Returns:
@@ -55,11 +110,58 @@ def save_entries(entries: List[Dict[str, Any]], data_dir: str) -> str:
         file_path = os.path.join(data_dir, filename)
         
         # Save entries to the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(entries, f, ensure_ascii=False, indent=4)
+        # Fastest compression level; the JSON still shrinks several times over
+        with gzip.open(file_path, 'wb', compresslevel=1) as f:
+            f.write(serialize_entries(entries))
             
-        logger.info(f"Saved {len(entries)} entries to {file_path}")
+        logger.info("Saved %d entries to %s", len(entries), file_path)
         return file_path
     except Exception as e:
-        logger.error(f"Error saving entries: {str(e)}")
-        raise 
\ No newline at end of file
+        logger.error("Error saving entries: %s", e)
+        raise 
+
+def load_http_cache(data_dir: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load the HTTP validator cache from the data directory.
+    
+    The validators are only valid while today's output file holds the
+    entries they describe, so they are ignored until that file exists
+    (e.g. on the first run of a new day).
+    
+    Args:
+        data_dir: Directory containing the cache file
+        
+    Returns:
+        Mapping of feed URL to its cached validators (empty if unavailable)
+    """
+    if not os.path.exists(os.path.join(data_dir, generate_filename())):
+        logger.info("No output saved today yet; ignoring cached HTTP validators")
+        return {}
+    
+    file_path = os.path.join(data_dir, HTTP_CACHE_FILENAME)
+    try:
+        with open(file_path, 'rb') as f:
+            cache = json.loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning("Ignoring unreadable HTTP cache %s: %s", file_path, e)
+        return {}
+
+def save_http_cache(cache: Dict[str, Dict[str, str]], data_dir: str) -> None:
+    """
+    Save the HTTP validator cache to the data directory.
+    
+    Args:
+        cache: Mapping of feed URL to its cached validators
+        data_dir: Directory to save the cache file in
+    """
+    try:
+        ensure_data_directory(data_dir)
+        file_path = os.path.join(data_dir, HTTP_CACHE_FILENAME)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+        logger.info("Saved HTTP cache for %d feeds to %s", len(cache), file_path)
+    except Exception as e:
+        logger.error("Error saving HTTP cache: %s", e)
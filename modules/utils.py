@@ -3,8 +3,11 @@ Utility functions for the BBC RSS scraper.
 """
 import logging
 import os
-from datetime import datetime
-from typing import Dict, Any, List
+import time
+from typing import List
+from urllib.parse import urlsplit
+
+from modules.models import Entry
 
 # Configure logging
 logger = logging.getLogger('bbc-rss-scraper')
@@ -21,7 +24,7 @@ def setup_logging(log_level: str = "INFO") -> None:
         level=numeric_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    logger.info(f"Logging configured with level: {log_level}")
+    logger.info("Logging configured with level: %s", log_level)
 
 def resolve_path(base_dir: str, relative_path: str) -> str:
     """
@@ -43,14 +46,29 @@ def get_timestamp() -> str:
     Returns:
         Formatted timestamp string
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+def _link_domain(link: str) -> str:
+    """
+    Extract the domain from a link.
+    
+    Args:
+        link: URL of an entry
+        
+    Returns:
+        Domain of the link, or an empty string if it cannot be parsed
+    """
+    try:
+        return urlsplit(link).netloc
+    except ValueError:  # e.g. an unterminated IPv6 host such as 'http://[bad/x'
+        return ''
 
-def format_entries_summary(entries: List[Dict[str, Any]]) -> str:
+def format_entries_summary(entries: List[Entry]) -> str:
     """
     Format a summary of the entries.
     
     Args:
-        entries: List of entry dictionaries
+        entries: List of entries
         
     Returns:
         Summary string
@@ -58,12 +76,7 @@ def format_entries_summary(entries: List[Dict[str, Any]]) -> str:
     if not entries:
         return "No entries found."
         
-    sources = set()
-    for entry in entries:
-        link = entry.get('link', '')
-        if link:
-            parts = link.split('/')
-            if len(parts) > 2:
-                sources.add(parts[2])  # Extract domain
+    sources = {_link_domain(entry.link) for entry in entries if entry.link}
+    sources.discard('')
     
     return f"Found {len(entries)} entries from {len(sources)} source(s)." 
\ No newline at end of file